@@ -932,18 +932,20 @@ class DefaultFailureConverter(FailureConverter):
         err: temporalio.exceptions.FailureError
         if failure.HasField("application_failure_info"):
             app_info = failure.application_failure_info
-            err = temporalio.exceptions.ApplicationError(
+            err = temporalio.exceptions.ApplicationError._from_failure(
                 failure.message or "Application error",
-                *payload_converter.from_payloads_wrapper(app_info.details),
-                type=app_info.type or None,
-                non_retryable=app_info.non_retryable,
-                next_retry_delay=app_info.next_retry_delay.ToTimedelta(),
+                app_info.type or None,
+                tuple(payload_converter.from_payloads_wrapper(app_info.details)),
+                app_info.non_retryable,
+                app_info.next_retry_delay.ToTimedelta(),
             )
         elif failure.HasField("timeout_failure_info"):
             timeout_info = failure.timeout_failure_info
             err = temporalio.exceptions.TimeoutError(
                 failure.message or "Timeout",
-                type=temporalio.exceptions.TimeoutType(int(timeout_info.timeout_type))
+                type=temporalio.exceptions._timeout_types_by_value[
+                    int(timeout_info.timeout_type)
+                ]
                 if timeout_info.timeout_type
                 else None,
                 last_heartbeat_details=payload_converter.from_payloads_wrapper(
@@ -973,7 +975,9 @@ class DefaultFailureConverter(FailureConverter):
                 identity=act_info.identity,
                 activity_type=act_info.activity_type.name,
                 activity_id=act_info.activity_id,
-                retry_state=temporalio.exceptions.RetryState(int(act_info.retry_state))
+                retry_state=temporalio.exceptions._retry_states_by_value[
+                    int(act_info.retry_state)
+                ]
                 if act_info.retry_state
                 else None,
             )
@@ -987,9 +991,9 @@ class DefaultFailureConverter(FailureConverter):
                 workflow_type=child_info.workflow_type.name,
                 initiated_event_id=child_info.initiated_event_id,
                 started_event_id=child_info.started_event_id,
-                retry_state=temporalio.exceptions.RetryState(
+                retry_state=temporalio.exceptions._retry_states_by_value[
                     int(child_info.retry_state)
-                )
+                ]
                 if child_info.retry_state
                 else None,
             )
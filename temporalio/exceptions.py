@@ -1,15 +1,25 @@
 """Common Temporal exceptions."""
 
+from __future__ import annotations
+
 import asyncio
+import copyreg
 from datetime import timedelta
 from enum import IntEnum
-from typing import Any, Optional, Sequence, Tuple
+from typing import Any, Dict, Optional, Sequence, Tuple, Type
 
-import temporalio.api.common.v1
-import temporalio.api.enums.v1
 import temporalio.api.failure.v1
 
+# Shared by all errors without details so they do not each hold their own empty
+# sequence
+_empty_details: Tuple[Any, ...] = ()
+
+_slot_unset = object()
+
 
+# These classes intentionally use no custom metaclass (e.g. ABCMeta or runtime
+# Generic) so isinstance checks against them, such as in
+# is_cancelled_exception, stay on the fast path
 class TemporalError(Exception):
     """Base for all Temporal exceptions."""
 
@@ -25,6 +35,8 @@ class TemporalError(Exception):
 class FailureError(TemporalError):
     """Base for runtime failures during workflow/activity execution."""
 
+    __slots__ = ("_message", "_failure")
+
     def __init__(
         self,
         message: str,
@@ -34,11 +46,31 @@ class FailureError(TemporalError):
     ) -> None:
         """Initialize a failure error."""
         if exc_args is None:
-            exc_args = (message,)
-        super().__init__(*exc_args)
+            super().__init__(message)
+        else:
+            super().__init__(*exc_args)
         self._message = message
         self._failure = failure
 
+    def __reduce__(self) -> Any:
+        """Pickle support."""
+        # Default exception pickling only captures __dict__ and re-calls the
+        # constructor with the exception args, which loses slot values and
+        # fails for keyword-only constructors. Instead, restore from the slot
+        # values without calling __init__. Slot names come from the same lookup
+        # object.__reduce_ex__ uses, which handles string-form __slots__ and
+        # private name mangling.
+        slot_values = {}
+        for name in copyreg._slotnames(type(self)):  # type: ignore[attr-defined]
+            value = getattr(self, name, _slot_unset)
+            if value is not _slot_unset:
+                slot_values[name] = value
+        return (
+            _restore_failure_error,
+            (type(self), self.args, slot_values),
+            self.__dict__ or None,
+        )
+
     @property
     def message(self) -> str:
         """Message."""
@@ -50,6 +82,16 @@ class FailureError(TemporalError):
         return self._failure
 
 
+def _restore_failure_error(
+    cls: Type[FailureError], args: Tuple[Any, ...], slot_values: Dict[str, Any]
+) -> FailureError:
+    err = cls.__new__(cls)
+    err.args = args
+    for name, value in slot_values.items():
+        setattr(err, name, value)
+    return err
+
+
 class WorkflowAlreadyStartedError(FailureError):
     """Thrown by a client or workflow when a workflow execution has already started.
 
@@ -60,11 +102,18 @@ class WorkflowAlreadyStartedError(FailureError):
             client.
     """
 
+    __slots__ = ("workflow_id", "workflow_type", "run_id")
+
     def __init__(
         self, workflow_id: str, workflow_type: str, *, run_id: Optional[str] = None
     ) -> None:
         """Initialize a workflow already started error."""
-        super().__init__("Workflow execution already started")
+        # Set the base fields directly instead of going through
+        # FailureError.__init__ since there is never a failure or custom args
+        message = "Workflow execution already started"
+        BaseException.__init__(self, message)
+        self._message = message
+        self._failure = None
         self.workflow_id = workflow_id
         self.workflow_type = workflow_type
         self.run_id = run_id
@@ -73,6 +122,8 @@ class WorkflowAlreadyStartedError(FailureError):
 class ApplicationError(FailureError):
     """Error raised during workflow/activity execution."""
 
+    __slots__ = ("_details", "_type", "_non_retryable", "_next_retry_delay")
+
     def __init__(
         self,
         message: str,
@@ -82,19 +133,45 @@ class ApplicationError(FailureError):
         next_retry_delay: Optional[timedelta] = None,
     ) -> None:
         """Initialize an application error."""
-        super().__init__(
-            message,
+        if not type:
+            super().__init__(message)
+        else:
             # If there is a type, prepend it to the message on the string repr
-            exc_args=(message if not type else f"{type}: {message}",),
-        )
-        self._details = details
+            super().__init__(message, exc_args=(f"{type}: {message}",))
+        self._details = details or _empty_details
         self._type = type
         self._non_retryable = non_retryable
         self._next_retry_delay = next_retry_delay
 
+    @classmethod
+    def _from_failure(
+        cls,
+        message: str,
+        type: Optional[str],
+        details: Tuple[Any, ...],
+        non_retryable: bool,
+        next_retry_delay: Optional[timedelta],
+    ) -> ApplicationError:
+        # Used by the failure converter to skip the keyword handling in
+        # __init__ since this is called for every converted application
+        # failure, including on replay. This must set the same attributes as
+        # __init__.
+        err = cls.__new__(cls)
+        BaseException.__init__(err, f"{type}: {message}" if type else message)
+        err._message = message
+        err._failure = None
+        err._details = details or _empty_details
+        err._type = type
+        err._non_retryable = non_retryable
+        err._next_retry_delay = next_retry_delay
+        return err
+
     @property
-    def details(self) -> Sequence[Any]:
-        """User-defined details on the error."""
+    def details(self) -> Tuple[Any, ...]:
+        """User-defined details on the error.
+
+        This is the tuple the error was created with, not a copy.
+        """
         return self._details
 
     @property
@@ -125,49 +202,60 @@ class ApplicationError(FailureError):
 class CancelledError(FailureError):
     """Error raised on workflow/activity cancellation."""
 
+    __slots__ = ("_details",)
+
     def __init__(self, message: str = "Cancelled", *details: Any) -> None:
         """Initialize a cancelled error."""
         super().__init__(message)
-        self._details = details
+        self._details = details or _empty_details
 
     @property
-    def details(self) -> Sequence[Any]:
-        """User-defined details on the error."""
+    def details(self) -> Tuple[Any, ...]:
+        """User-defined details on the error.
+
+        This is the tuple the error was created with, not a copy.
+        """
         return self._details
 
 
 class TerminatedError(FailureError):
     """Error raised on workflow cancellation."""
 
+    __slots__ = ("_details",)
+
     def __init__(self, message: str, *details: Any) -> None:
         """Initialize a terminated error."""
         super().__init__(message)
-        self._details = details
+        self._details = details or _empty_details
 
     @property
-    def details(self) -> Sequence[Any]:
-        """User-defined details on the error."""
+    def details(self) -> Tuple[Any, ...]:
+        """User-defined details on the error.
+
+        This is the tuple the error was created with, not a copy.
+        """
         return self._details
 
 
 class TimeoutType(IntEnum):
     """Type of timeout for :py:class:`TimeoutError`."""
 
-    START_TO_CLOSE = int(
-        temporalio.api.enums.v1.TimeoutType.TIMEOUT_TYPE_START_TO_CLOSE
-    )
-    SCHEDULE_TO_START = int(
-        temporalio.api.enums.v1.TimeoutType.TIMEOUT_TYPE_SCHEDULE_TO_START
-    )
-    SCHEDULE_TO_CLOSE = int(
-        temporalio.api.enums.v1.TimeoutType.TIMEOUT_TYPE_SCHEDULE_TO_CLOSE
-    )
-    HEARTBEAT = int(temporalio.api.enums.v1.TimeoutType.TIMEOUT_TYPE_HEARTBEAT)
+    # Values match temporalio.api.enums.v1.TimeoutType which are wire-stable
+    START_TO_CLOSE = 1
+    SCHEDULE_TO_START = 2
+    SCHEDULE_TO_CLOSE = 3
+    HEARTBEAT = 4
+
+
+# Prebuilt reverse lookup so converting from protobuf skips enum construction
+_timeout_types_by_value: Dict[int, TimeoutType] = {int(t): t for t in TimeoutType}
 
 
 class TimeoutError(FailureError):
     """Error raised on workflow/activity timeout."""
 
+    __slots__ = ("_type", "_last_heartbeat_details")
+
     def __init__(
         self,
         message: str,
@@ -194,6 +282,8 @@ class TimeoutError(FailureError):
 class ServerError(FailureError):
     """Error originating in the Temporal server."""
 
+    __slots__ = ("_non_retryable",)
+
     def __init__(self, message: str, *, non_retryable: bool = False) -> None:
         """Initialize a server error."""
         super().__init__(message)
@@ -208,28 +298,32 @@ class ServerError(FailureError):
 class RetryState(IntEnum):
     """Current retry state of the workflow/activity during error."""
 
-    IN_PROGRESS = int(temporalio.api.enums.v1.RetryState.RETRY_STATE_IN_PROGRESS)
-    NON_RETRYABLE_FAILURE = int(
-        temporalio.api.enums.v1.RetryState.RETRY_STATE_NON_RETRYABLE_FAILURE
-    )
-    TIMEOUT = int(temporalio.api.enums.v1.RetryState.RETRY_STATE_TIMEOUT)
-    MAXIMUM_ATTEMPTS_REACHED = int(
-        temporalio.api.enums.v1.RetryState.RETRY_STATE_MAXIMUM_ATTEMPTS_REACHED
-    )
-    RETRY_POLICY_NOT_SET = int(
-        temporalio.api.enums.v1.RetryState.RETRY_STATE_RETRY_POLICY_NOT_SET
-    )
-    INTERNAL_SERVER_ERROR = int(
-        temporalio.api.enums.v1.RetryState.RETRY_STATE_INTERNAL_SERVER_ERROR
-    )
-    CANCEL_REQUESTED = int(
-        temporalio.api.enums.v1.RetryState.RETRY_STATE_CANCEL_REQUESTED
-    )
+    # Values match temporalio.api.enums.v1.RetryState which are wire-stable
+    IN_PROGRESS = 1
+    NON_RETRYABLE_FAILURE = 2
+    TIMEOUT = 3
+    MAXIMUM_ATTEMPTS_REACHED = 4
+    RETRY_POLICY_NOT_SET = 5
+    INTERNAL_SERVER_ERROR = 6
+    CANCEL_REQUESTED = 7
+
+
+# Prebuilt reverse lookup so converting from protobuf skips enum construction
+_retry_states_by_value: Dict[int, RetryState] = {int(s): s for s in RetryState}
 
 
 class ActivityError(FailureError):
     """Error raised on activity failure."""
 
+    __slots__ = (
+        "_scheduled_event_id",
+        "_started_event_id",
+        "_identity",
+        "_activity_type",
+        "_activity_id",
+        "_retry_state",
+    )
+
     def __init__(
         self,
         message: str,
@@ -284,6 +378,16 @@ class ActivityError(FailureError):
 class ChildWorkflowError(FailureError):
     """Error raised on child workflow failure."""
 
+    __slots__ = (
+        "_namespace",
+        "_workflow_id",
+        "_run_id",
+        "_workflow_type",
+        "_initiated_event_id",
+        "_started_event_id",
+        "_retry_state",
+    )
+
     def __init__(
         self,
         message: str,
@@ -342,6 +446,18 @@ class ChildWorkflowError(FailureError):
         return self._retry_state
 
 
+# Exception type groupings used in cancellation checks, built once so callers
+# can pass them straight to isinstance
+_cancel_types: Tuple[Type[BaseException], ...] = (
+    asyncio.CancelledError,
+    CancelledError,
+)
+_wrapped_failure_types: Tuple[Type[FailureError], ...] = (
+    ActivityError,
+    ChildWorkflowError,
+)
+
+
 def is_cancelled_exception(exception: BaseException) -> bool:
     """Check whether the given exception is considered a cancellation exception
     according to Temporal.
@@ -358,14 +474,9 @@ def is_cancelled_exception(exception: BaseException) -> bool:
     Returns:
         True if a cancelled exception, false if not.
     """
-    return (
-        isinstance(exception, asyncio.CancelledError)
-        or isinstance(exception, CancelledError)
-        or (
-            (
-                isinstance(exception, ActivityError)
-                or isinstance(exception, ChildWorkflowError)
-            )
-            and isinstance(exception.cause, CancelledError)
-        )
+    # Check the direct cancel types first since they are the common case
+    if isinstance(exception, _cancel_types):
+        return True
+    return isinstance(exception, _wrapped_failure_types) and isinstance(
+        exception.__cause__, CancelledError
     )
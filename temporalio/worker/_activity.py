@@ -463,10 +463,7 @@ class _ActivityWorker:
                     temporalio.activity.logger.debug("Completing asynchronously")
                     completion.result.will_complete_async.SetInParent()
                 elif (
-                    isinstance(
-                        err,
-                        (asyncio.CancelledError, temporalio.exceptions.CancelledError),
-                    )
+                    isinstance(err, temporalio.exceptions._cancel_types)
                     and running_activity.cancelled_due_to_heartbeat_error
                 ):
                     err = running_activity.cancelled_due_to_heartbeat_error
@@ -477,10 +474,7 @@ class _ActivityWorker:
                         err, completion.result.failed.failure
                     )
                 elif (
-                    isinstance(
-                        err,
-                        (asyncio.CancelledError, temporalio.exceptions.CancelledError),
-                    )
+                    isinstance(err, temporalio.exceptions._cancel_types)
                     and running_activity.cancelled_by_request
                 ):
                     temporalio.activity.logger.debug("Completing as cancelled")
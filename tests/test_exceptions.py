@@ -0,0 +1,249 @@
+import pickle
+import typing
+from datetime import timedelta
+
+import pytest
+
+import temporalio.api.enums.v1
+import temporalio.api.failure.v1
+from temporalio.exceptions import (
+    ActivityError,
+    ApplicationError,
+    CancelledError,
+    ChildWorkflowError,
+    FailureError,
+    RetryState,
+    ServerError,
+    TemporalError,
+    TerminatedError,
+    TimeoutError,
+    TimeoutType,
+    WorkflowAlreadyStartedError,
+)
+
+
+def test_enum_values_match_proto():
+    # Values are hardcoded to avoid importing protos, so confirm they match
+    for timeout_type in TimeoutType:
+        assert timeout_type.value == temporalio.api.enums.v1.TimeoutType.Value(
+            f"TIMEOUT_TYPE_{timeout_type.name}"
+        )
+    for retry_state in RetryState:
+        assert retry_state.value == temporalio.api.enums.v1.RetryState.Value(
+            f"RETRY_STATE_{retry_state.name}"
+        )
+    # Confirm no proto values are missing
+    assert len(TimeoutType) == len(temporalio.api.enums.v1.TimeoutType.values()) - 1
+    assert len(RetryState) == len(temporalio.api.enums.v1.RetryState.values()) - 1
+
+
+def test_exception_type_hints_resolve():
+    hints = typing.get_type_hints(FailureError.__init__)
+    assert hints["failure"] == typing.Optional[temporalio.api.failure.v1.Failure]
+
+
+def test_exception_pickle_with_slots():
+    err = ApplicationError(
+        "some message",
+        "detail1",
+        2,
+        type="SomeType",
+        non_retryable=True,
+        next_retry_delay=timedelta(seconds=3),
+    )
+    err = pickle.loads(pickle.dumps(err))
+    assert str(err) == "SomeType: some message"
+    assert err.message == "some message"
+    assert list(err.details) == ["detail1", 2]
+    assert err.type == "SomeType"
+    assert err.non_retryable
+    assert err.next_retry_delay == timedelta(seconds=3)
+
+    cancel_err = pickle.loads(pickle.dumps(CancelledError("cancel", "detail")))
+    assert cancel_err.message == "cancel"
+    assert list(cancel_err.details) == ["detail"]
+
+    server_err = pickle.loads(pickle.dumps(ServerError("server", non_retryable=True)))
+    assert server_err.message == "server"
+    assert server_err.non_retryable
+
+    timeout_err = pickle.loads(
+        pickle.dumps(
+            TimeoutError(
+                "timeout",
+                type=TimeoutType.HEARTBEAT,
+                last_heartbeat_details=["detail"],
+            )
+        )
+    )
+    assert timeout_err.message == "timeout"
+    assert timeout_err.type == TimeoutType.HEARTBEAT
+    assert list(timeout_err.last_heartbeat_details) == ["detail"]
+
+    activity_err = pickle.loads(
+        pickle.dumps(
+            ActivityError(
+                "activity",
+                scheduled_event_id=1,
+                started_event_id=2,
+                identity="some-identity",
+                activity_type="SomeActivity",
+                activity_id="some-activity-id",
+                retry_state=RetryState.TIMEOUT,
+            )
+        )
+    )
+    assert activity_err.message == "activity"
+    assert activity_err.scheduled_event_id == 1
+    assert activity_err.started_event_id == 2
+    assert activity_err.identity == "some-identity"
+    assert activity_err.activity_type == "SomeActivity"
+    assert activity_err.activity_id == "some-activity-id"
+    assert activity_err.retry_state == RetryState.TIMEOUT
+
+    child_err = pickle.loads(
+        pickle.dumps(
+            ChildWorkflowError(
+                "child",
+                namespace="some-namespace",
+                workflow_id="some-workflow-id",
+                run_id="some-run-id",
+                workflow_type="SomeWorkflow",
+                initiated_event_id=1,
+                started_event_id=2,
+                retry_state=None,
+            )
+        )
+    )
+    assert child_err.message == "child"
+    assert child_err.namespace == "some-namespace"
+    assert child_err.workflow_id == "some-workflow-id"
+    assert child_err.run_id == "some-run-id"
+    assert child_err.workflow_type == "SomeWorkflow"
+    assert child_err.initiated_event_id == 1
+    assert child_err.started_event_id == 2
+    assert child_err.retry_state is None
+
+    already_started_err = pickle.loads(
+        pickle.dumps(
+            WorkflowAlreadyStartedError(
+                "some-workflow-id", "SomeWorkflow", run_id="some-run-id"
+            )
+        )
+    )
+    assert already_started_err.message == "Workflow execution already started"
+    assert already_started_err.workflow_id == "some-workflow-id"
+    assert already_started_err.workflow_type == "SomeWorkflow"
+    assert already_started_err.run_id == "some-run-id"
+
+
+class CustomApplicationError(ApplicationError):
+    def __init__(self, extra: str) -> None:
+        super().__init__("custom message", type="CustomType")
+        self.extra = extra
+
+
+class SlottedApplicationError(ApplicationError):
+    __slots__ = "extra"
+
+    def __init__(self, extra: str) -> None:
+        super().__init__("slotted message")
+        self.extra = extra
+
+
+class PrivateSlottedApplicationError(SlottedApplicationError):
+    __slots__ = ("__priv",)
+
+    def __init__(self, extra: str, priv: str) -> None:
+        super().__init__(extra)
+        self.__priv = priv
+
+    @property
+    def priv(self) -> str:
+        return self.__priv
+
+
+def test_exception_pickle_subclass():
+    err = pickle.loads(pickle.dumps(CustomApplicationError("some extra")))
+    assert isinstance(err, CustomApplicationError)
+    assert str(err) == "CustomType: custom message"
+    assert err.extra == "some extra"
+
+    # Subclasses with their own string-form and private name-mangled slots
+    slotted_err = pickle.loads(
+        pickle.dumps(PrivateSlottedApplicationError("some extra", "some priv"))
+    )
+    assert isinstance(slotted_err, PrivateSlottedApplicationError)
+    assert str(slotted_err) == "slotted message"
+    assert slotted_err.extra == "some extra"
+    assert slotted_err.priv == "some priv"
+
+
+def test_application_error_from_failure_matches_init():
+    for type in [None, "", "SomeType"]:
+        expected = ApplicationError(
+            "some message",
+            "detail1",
+            type=type,
+            non_retryable=True,
+            next_retry_delay=timedelta(seconds=3),
+        )
+        actual = ApplicationError._from_failure(
+            "some message", type, ("detail1",), True, timedelta(seconds=3)
+        )
+        assert str(actual) == str(expected)
+        assert actual.args == expected.args
+        assert actual.message == expected.message
+        assert actual.failure is None
+        assert actual.details == expected.details
+        assert actual.type == expected.type
+        assert actual.non_retryable == expected.non_retryable
+        assert actual.next_retry_delay == expected.next_retry_delay
+
+    # Empty details use the same shared tuple on both paths
+    assert (
+        ApplicationError._from_failure("message", None, (), False, None).details
+        is ApplicationError("message").details
+    )
+
+
+def test_application_error_str_uses_args():
+    for err in [
+        ApplicationError("some message", type="SomeType"),
+        ApplicationError._from_failure("some message", "SomeType", (), False, None),
+    ]:
+        assert err.args == ("SomeType: some message",)
+        assert str(err) == "SomeType: some message"
+        # Mutated args, such as when appending a stack, must show in the string
+        err.args = (f"{err}\nStack:\nsome stack",)
+        assert str(err) == "SomeType: some message\nStack:\nsome stack"
+    assert ApplicationError("some message").args == ("some message",)
+
+
+def test_exceptions_have_no_custom_metaclass():
+    # Custom metaclasses slow down isinstance checks which are common for these
+    for cls in [
+        TemporalError,
+        FailureError,
+        WorkflowAlreadyStartedError,
+        ApplicationError,
+        CancelledError,
+        TerminatedError,
+        TimeoutError,
+        ServerError,
+        ActivityError,
+        ChildWorkflowError,
+    ]:
+        assert type(cls) is type
+
+
+def test_application_error_subclass_property_override():
+    class OverriddenTypeError(ApplicationError):
+        @property
+        def type(self) -> str:
+            return "OverriddenType"
+
+    err = OverriddenTypeError("message", type="SomeType")
+    assert err.type == "OverriddenType"
+    with pytest.raises(AttributeError):
+        del ApplicationError("message").details